@@ -57,6 +57,12 @@
           openssl # libssl.so, libcrypto.so (for reqwest with rustls-tls)
           zlib # libz.so.1 (for flate2)
         ];
+
+        # Python environment for nix/update-standalone-releases.py
+        updateScriptPython = pkgs.python3.withPackages (ps: [
+          ps.urllib3
+          ps.orjson
+        ]);
       in
       let
 
@@ -301,7 +307,7 @@
             type = "app";
             program = toString (pkgs.writeShellScript "update-releases" ''
               set -e
-              export PATH="${pkgs.lib.makeBinPath [ pkgs.python3 pkgs.nix pkgs.git ]}:$PATH"
+              export PATH="${pkgs.lib.makeBinPath [ updateScriptPython pkgs.git ]}:$PATH"
 
               # Check if we're in a git repository
               if ! ${pkgs.git}/bin/git rev-parse --git-dir > /dev/null 2>&1; then
@@ -312,7 +318,7 @@
               # Find the script in the nix directory
               if [ -f "./nix/update-standalone-releases.py" ]; then
                 # Pass nix/releases.json as the file to update, forward any additional arguments (like --force)
-                exec ${pkgs.python3}/bin/python3 ./nix/update-standalone-releases.py nix/releases.json "$@"
+                exec ${updateScriptPython}/bin/python3 ./nix/update-standalone-releases.py nix/releases.json "$@"
               else
                 echo "Error: nix/update-standalone-releases.py not found"
                 exit 1
@@ -3,17 +3,27 @@
 Update script to fetch latest standalone releases and update releases.json
 """
 
+import base64
+import hashlib
+import heapq
 import json
-import subprocess
-import sys
-import tempfile
 import re
+import sys
 import argparse
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
-import urllib.request
-import urllib.error
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import urllib3
+
+try:
+    import orjson
+except ImportError:  # Optional, only used to speed up JSON handling
+    orjson = None
 
 # Configuration
 # Note: Currently only mvr has standalone binaries with the naming pattern `mvr-ubuntu-x86_64`
@@ -28,110 +38,186 @@ REPOS = {
     "walrus-sites": "MystenLabs/walrus-sites",
 }
 
+BINARIES = ["mvr", "sui", "walrus", "walrus-sites"]
+
+# Binaries without network variants, for which the latest release is enough
+LATEST_ONLY_BINARIES = {"mvr"}
+
 NUM_RELEASES = 1  # Number of releases to fetch per network/type
+RELEASES_PER_PAGE = NUM_RELEASES * 10  # Search more releases to find diversity
+MAX_BINARY_WORKERS = 4  # Number of binaries processed concurrently
+MAX_DOWNLOAD_WORKERS = 8  # Number of release assets hashed concurrently per binary
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # Bytes read from a download at a time
+DOWNLOAD_RESUME_ATTEMPTS = 3  # Range requests sent after an interrupted download
 
 
-# Global flag for color output (will be set by main())
-USE_COLOR = True
+USER_AGENT = "suiup-update-script"
+
+# Headers for GitHub API requests. A token from GITHUB_TOKEN or GH_TOKEN lifts
+# the anonymous rate limit of 60 requests per hour.
+GITHUB_API_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept": "application/vnd.github+json",
+    "X-GitHub-Api-Version": "2022-11-28",
+}
+_github_token = os.environ.get("GITHUB_TOKEN") or os.environ.get("GH_TOKEN")
+if _github_token:
+    GITHUB_API_HEADERS["Authorization"] = f"Bearer {_github_token}"
+
+# Shared connection pool, so TLS connections to GitHub are reused across
+# requests and worker threads
+_HTTP = urllib3.PoolManager(
+    maxsize=16,
+    retries=urllib3.Retry(total=3, backoff_factor=0.3),
+)
+
+
+# Cache of asset url -> SRI hash, stored next to releases.json. Release assets
+# are immutable, so a cached hash never has to be recomputed.
+HASH_CACHE_FILENAME = ".release-hash-cache.json"
+_hash_cache: Dict[str, str] = {}
+_hash_cache_dirty = False
+_hash_cache_lock = threading.Lock()
+
+# ANSI color codes for output
+COLOR_CODES = {
+    "RED": "\033[0;31m",
+    "GREEN": "\033[0;32m",
+    "YELLOW": "\033[1;33m",
+    "BLUE": "\033[0;34m",
+    "NC": "\033[0m",
+}
 
 
-# Colors for output
-class Colors:
-    @staticmethod
-    def _color(code: str) -> str:
-        """Return color code if colors are enabled, empty string otherwise."""
-        return code if USE_COLOR else ""
+def make_colors(enabled: bool) -> SimpleNamespace:
+    """Build the color table, with empty strings if colors are disabled."""
+    return SimpleNamespace(
+        **{name: code if enabled else "" for name, code in COLOR_CODES.items()}
+    )
 
-    @property
-    def RED(self) -> str:
-        return self._color("\033[0;31m")
 
-    @property
-    def GREEN(self) -> str:
-        return self._color("\033[0;32m")
+# Colors for output (rebuilt by main() once --no-color is known)
+Colors = make_colors(True)
 
-    @property
-    def YELLOW(self) -> str:
-        return self._color("\033[1;33m")
+# Serializes stderr output from worker threads
+_log_lock = threading.Lock()
 
-    @property
-    def BLUE(self) -> str:
-        return self._color("\033[0;34m")
 
-    @property
-    def NC(self) -> str:
-        return self._color("\033[0m")
+def log(message: str = "") -> None:
+    """Write a line to stderr without interleaving with other threads."""
+    with _log_lock:
+        sys.stderr.write(message + "\n")
 
 
-# Create a singleton instance
-Colors = Colors()
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON, using orjson if it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 
-def get_filename_pattern(binary: str) -> str:
-    """Get the filename pattern for a binary.
+def json_dumps(obj: Any, sort_keys: bool = False) -> str:
+    """Serialize to JSON indented by 2 spaces with a trailing newline.
 
-    Returns a pattern that will be matched against asset names.
-    For .tgz archives, we match the pattern within the filename.
+    Uses orjson if it is installed, which produces the same output.
     """
-    patterns = {
-        "mvr": "mvr-ubuntu-x86_64",  # Direct binary: mvr-ubuntu-x86_64
-        "sui": "sui-.*-ubuntu-x86_64.tgz",  # Archive: sui-testnet-v1.59.0-ubuntu-x86_64.tgz
-        "walrus": "walrus-.*-ubuntu-x86_64.tgz",  # Archive: walrus-testnet-v1.35.0-ubuntu-x86_64.tgz
-        "walrus-sites": "site-builder-.*-ubuntu-x86_64.tgz",  # Archive: site-builder-mainnet-v1.3.0-ubuntu-x86_64.tgz
-    }
-    return patterns.get(binary, f"{binary}-ubuntu-x86_64")
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2, sort_keys=sort_keys) + "\n"
+
+
+def exact_asset(name: str) -> Callable[[str], bool]:
+    """Match asset names equal to `name` (direct binaries)."""
+    return lambda asset_name: asset_name == name
+
+
+def archive_asset(prefix: str, suffix: str) -> Callable[[str], bool]:
+    """Match asset names of the form `<prefix>*<suffix>` (.tgz archives)."""
+    min_length = len(prefix) + len(suffix)
+    return lambda asset_name: (
+        len(asset_name) >= min_length
+        and asset_name.startswith(prefix)
+        and asset_name.endswith(suffix)
+    )
+
+
+# Asset name matchers per binary
+ASSET_MATCHERS = {
+    # Direct binary: mvr-ubuntu-x86_64
+    "mvr": exact_asset("mvr-ubuntu-x86_64"),
+    # Archive: sui-testnet-v1.59.0-ubuntu-x86_64.tgz
+    "sui": archive_asset("sui-", "-ubuntu-x86_64.tgz"),
+    # Archive: walrus-testnet-v1.35.0-ubuntu-x86_64.tgz
+    "walrus": archive_asset("walrus-", "-ubuntu-x86_64.tgz"),
+    # Archive: site-builder-mainnet-v1.3.0-ubuntu-x86_64.tgz
+    "walrus-sites": archive_asset("site-builder-", "-ubuntu-x86_64.tgz"),
+}
+
+
+def get_asset_matcher(binary: str) -> Callable[[str], bool]:
+    """Get the predicate that selects the release asset of a binary."""
+    return ASSET_MATCHERS.get(binary) or exact_asset(f"{binary}-ubuntu-x86_64")
 
 
 def fetch_releases(binary: str, repo: str) -> List[Dict[str, str]]:
     """Fetch releases from GitHub API."""
-    print(
-        f"{Colors.BLUE}Fetching latest {NUM_RELEASES} releases for {binary}...{Colors.NC}",
-        file=sys.stderr,
+    log(
+        f"{Colors.BLUE}Fetching latest {NUM_RELEASES} releases for {binary}...{Colors.NC}"
     )
 
-    url = f"https://api.github.com/repos/{repo}/releases"
-    filename_pattern = get_filename_pattern(binary)
+    if binary in LATEST_ONLY_BINARIES:
+        url = f"https://api.github.com/repos/{repo}/releases/latest"
+    else:
+        url = (
+            f"https://api.github.com/repos/{repo}/releases?per_page={RELEASES_PER_PAGE}"
+        )
+    matches_asset = get_asset_matcher(binary)
 
     try:
-        req = urllib.request.Request(url)
-        req.add_header("User-Agent", "suiup-update-script")
-
-        with urllib.request.urlopen(req) as response:
-            releases_data = json.loads(response.read())
-    except urllib.error.URLError as e:
-        print(
-            f"{Colors.RED}Failed to fetch releases from GitHub: {e}{Colors.NC}",
-            file=sys.stderr,
+        response = _HTTP.request(
+            "GET", url, headers=GITHUB_API_HEADERS, preload_content=False
         )
+        try:
+            if response.status != 200:
+                raise urllib3.exceptions.HTTPError(f"HTTP {response.status}")
+            # Parse the streamed body without caching it on the response, so
+            # only the parsed data stays alive while filtering
+            releases_data = json_loads(response.read())
+        finally:
+            response.drain_conn()
+            response.release_conn()
+    except urllib3.exceptions.HTTPError as e:
+        log(f"{Colors.RED}Failed to fetch releases from GitHub: {e}{Colors.NC}")
         return []
+    if binary in LATEST_ONLY_BINARIES:
+        # /releases/latest returns a single release object
+        releases_data = [releases_data]
 
     # Filter releases that have the required asset
-    # Compile pattern as regex
-    pattern_re = re.compile(filename_pattern)
-
     filtered_releases = []
 
     # For tools with network variants (sui, walrus, walrus-sites), try to get diverse networks
     # Track which network types we've seen
     network_counts = {}
 
-    for release in releases_data[
-        : NUM_RELEASES * 10
-    ]:  # Search more releases to find diversity
-        assets = release.get("assets", [])
-        matching_asset = None
-
-        for asset in assets:
-            # Use regex match for .tgz patterns, exact match for direct binaries
-            if pattern_re.fullmatch(asset["name"]):
-                matching_asset = asset
-                break
+    for release in releases_data:
+        # Look up each asset name once and keep only (name, url) of the match
+        matching_asset = next(
+            (
+                (name, asset["browser_download_url"])
+                for asset in release.get("assets", [])
+                if matches_asset(name := asset["name"])
+            ),
+            None,
+        )
 
         if matching_asset:
+            filename, download_url = matching_asset
             tag = release["tag_name"]
-
-            # Extract network type from tag (e.g., "mainnet-v1.58.3" -> "mainnet")
-            network = tag.split("-")[0] if "-" in tag else "default"
+            network = get_network(tag)
 
             # For network-based releases, limit to NUM_RELEASES per network
             if network != "default":
@@ -142,8 +228,8 @@ def fetch_releases(binary: str, repo: str) -> List[Dict[str, str]]:
             filtered_releases.append(
                 {
                     "tag": tag,
-                    "url": matching_asset["browser_download_url"],
-                    "filename": matching_asset["name"],
+                    "url": download_url,
+                    "filename": filename,
                 }
             )
 
@@ -153,62 +239,114 @@ def fetch_releases(binary: str, repo: str) -> List[Dict[str, str]]:
                 break
 
     if not filtered_releases:
-        print(
-            f"{Colors.YELLOW}Warning: No releases found for {binary}{Colors.NC}",
-            file=sys.stderr,
-        )
+        log(f"{Colors.YELLOW}Warning: No releases found for {binary}{Colors.NC}")
 
     return filtered_releases
 
 
-def compute_hash(url: str) -> Optional[str]:
-    """Download a file and compute its Nix SRI hash."""
+def load_hash_cache(path: Path) -> None:
+    """Load the asset hash cache, starting empty if it is missing or invalid."""
+    global _hash_cache
     try:
-        with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-            tmp_path = tmp_file.name
-
-            # Download the file
-            req = urllib.request.Request(url)
-            req.add_header("User-Agent", "suiup-update-script")
-
-            with urllib.request.urlopen(req) as response:
-                tmp_file.write(response.read())
-
-        # Compute SHA256 hash
-        result = subprocess.run(
-            ["nix-hash", "--type", "sha256", "--flat", tmp_path],
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        hash_hex = result.stdout.strip()
-
-        # Convert to SRI format
-        result = subprocess.run(
-            [
-                "nix",
-                "hash",
-                "convert",
-                "--hash-algo",
-                "sha256",
-                "--to",
-                "sri",
-                hash_hex,
-            ],
-            capture_output=True,
-            text=True,
-            check=True,
+        _hash_cache = json_loads(path.read_text())
+    except (OSError, json.JSONDecodeError):
+        _hash_cache = {}
+
+
+def save_hash_cache(path: Path) -> None:
+    """Atomically write the asset hash cache if it has changed."""
+    if not _hash_cache_dirty:
+        return
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text(json_dumps(_hash_cache, sort_keys=True))
+    os.replace(tmp_path, path)
+
+
+def download_sha256(url: str) -> bytes:
+    """Download a file and return its SHA-256 digest.
+
+    The body is streamed into the hash. If the transfer stops before
+    Content-Length bytes arrived, it is resumed with a Range request, feeding
+    the remaining bytes into the same hash.
+    """
+    digest = hashlib.sha256()
+    received = 0
+    expected: Optional[int] = None
+
+    for _ in range(DOWNLOAD_RESUME_ATTEMPTS + 1):
+        headers = {"User-Agent": USER_AGENT}
+        if received:
+            headers["Range"] = f"bytes={received}-"
+
+        response = _HTTP.request("GET", url, headers=headers, preload_content=False)
+        try:
+            if response.status == 200:
+                # Full body, also if the server ignored the Range header
+                digest = hashlib.sha256()
+                received = 0
+                content_length = response.headers.get("Content-Length")
+                expected = int(content_length) if content_length else None
+            elif not (
+                response.status == 206
+                and received
+                and response.headers.get("Content-Range", "").startswith(
+                    f"bytes {received}-"
+                )
+            ):
+                response.drain_conn()
+                raise RuntimeError(f"HTTP {response.status} for {url}")
+
+            # Hash the download as it arrives, so at most one chunk is held in
+            # memory. Content decoding is disabled to hash the exact bytes Nix
+            # will fetch.
+            try:
+                for chunk in response.stream(DOWNLOAD_CHUNK_SIZE, decode_content=False):
+                    digest.update(chunk)
+                    received += len(chunk)
+            except (
+                urllib3.exceptions.ProtocolError,
+                urllib3.exceptions.ReadTimeoutError,
+            ) as e:
+                log(
+                    f"{Colors.YELLOW}  Download of {url} interrupted after {received} bytes: {e}{Colors.NC}"
+                )
+                continue
+        finally:
+            response.release_conn()
+
+        if expected is None or received == expected:
+            return digest.digest()
+
+        log(
+            f"{Colors.YELLOW}  Download of {url} incomplete: {received} of {expected} bytes{Colors.NC}"
         )
-        sri_hash = result.stdout.strip()
 
-        # Clean up
-        Path(tmp_path).unlink()
+    raise RuntimeError(
+        f"Download of {url} incomplete after {DOWNLOAD_RESUME_ATTEMPTS} resume attempts"
+    )
+
+
+def compute_hash(url: str) -> Optional[str]:
+    """Download a file and compute its Nix SRI hash."""
+    global _hash_cache_dirty
+    with _hash_cache_lock:
+        cached = _hash_cache.get(url)
+    if cached:
+        return cached
 
-        return sri_hash
+    try:
+        digest = download_sha256(url)
+        # Nix SRI format: "sha256-" followed by the base64 encoded digest
+        sri_hash = "sha256-" + base64.b64encode(digest).decode()
     except Exception as e:
-        print(f"{Colors.RED}Failed to compute hash: {e}{Colors.NC}", file=sys.stderr)
+        log(f"{Colors.RED}Failed to compute hash: {e}{Colors.NC}")
         return None
 
+    with _hash_cache_lock:
+        _hash_cache[url] = sri_hash
+        _hash_cache_dirty = True
+    return sri_hash
+
 
 def generate_releases_for_binary(binary: str, repo: str) -> Dict[str, Dict[str, str]]:
     """Generate version -> {hash, url} mapping for a binary."""
@@ -217,35 +355,61 @@ def generate_releases_for_binary(binary: str, repo: str) -> Dict[str, Dict[str,
     if not releases:
         return {}
 
+    def process(release: Dict[str, str]) -> Optional[str]:
+        log(f"{Colors.GREEN}  Processing {binary} {release['tag']}...{Colors.NC}")
+        return compute_hash(release["url"])
+
+    # Downloads dominate, so hash several releases at once
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_DOWNLOAD_WORKERS, len(releases))
+    ) as executor:
+        hashes = list(executor.map(process, releases))
+
     result = {}
-    for release in releases:
+    for release, hash_value in zip(releases, hashes):
         tag = release["tag"]
-        url = release["url"]
 
-        print(
-            f"{Colors.GREEN}  Processing {binary} {tag}...{Colors.NC}", file=sys.stderr
-        )
-
-        hash_value = compute_hash(url)
         if not hash_value:
-            print(
-                f"{Colors.RED}  Failed to compute hash for {tag}{Colors.NC}",
-                file=sys.stderr,
-            )
+            log(f"{Colors.RED}  Failed to compute hash for {binary} {tag}{Colors.NC}")
             continue
 
-        print(f"{Colors.GREEN}  Hash: {hash_value}{Colors.NC}", file=sys.stderr)
+        log(f"{Colors.GREEN}  Hash for {binary} {tag}: {hash_value}{Colors.NC}")
         result[tag] = {
             "hash": hash_value,
-            "url": url,
+            "url": release["url"],
         }
 
     return result
 
 
+def version_key(version: str) -> tuple[tuple[int, ...], str]:
+    """Sort key ordering version tags by their numeric components.
+
+    Plain string order would treat "mainnet-v1.10.0" as older than "mainnet-v1.9.0".
+    """
+    return tuple(int(n) for n in re.findall(r"\d+", version)), version
+
+
+def get_network(version: str) -> str:
+    """Extract the network from a version tag ("mainnet-v1.58.3" -> "mainnet")."""
+    return version.split("-", 1)[0] if "-" in version else "default"
+
+
+@dataclass
+class CleanupResult:
+    """Outcome of cleanup_old_releases()."""
+
+    # Kept releases, version -> release info
+    kept: Dict[str, Dict[str, str]]
+    # Removed versions, sorted
+    removed: List[str]
+    # Kept versions per network, latest first
+    groups: Dict[str, List[str]]
+
+
 def cleanup_old_releases(
     releases: Dict[str, Dict[str, str]], max_per_network: int = 10
-) -> tuple[Dict[str, Dict[str, str]], List[str]]:
+) -> CleanupResult:
     """Keep only the latest N releases per network type.
 
     Args:
@@ -253,33 +417,64 @@ def cleanup_old_releases(
         max_per_network: Maximum number of releases to keep per network (default: 10)
 
     Returns:
-        Tuple of (cleaned up releases dict, list of removed versions)
+        CleanupResult with the kept releases, removed versions and kept
+        versions grouped by network
     """
     # Group releases by network
     network_groups: Dict[str, List[str]] = {}
     for version in releases.keys():
-        # Extract network from version (e.g., "mainnet-v1.58.3" -> "mainnet")
-        network = version.split("-")[0] if "-" in version else "default"
-        if network not in network_groups:
-            network_groups[network] = []
-        network_groups[network].append(version)
-
-    # Keep only latest releases per network
-    versions_to_keep = set()
-    removed_versions = []
+        network_groups.setdefault(get_network(version), []).append(version)
+
+    # Keep the max_per_network latest versions without sorting all of them.
+    # nlargest returns them latest first.
     for network, versions in network_groups.items():
-        # Sort versions in descending order (latest first)
-        sorted_versions = sorted(versions, reverse=True)
-        # Keep only the latest max_per_network
-        kept = sorted_versions[:max_per_network]
-        removed = sorted_versions[max_per_network:]
-        versions_to_keep.update(kept)
-        removed_versions.extend(removed)
+        network_groups[network] = heapq.nlargest(
+            max_per_network, versions, key=version_key
+        )
+
+    versions_to_keep = {v for versions in network_groups.values() for v in versions}
+    kept = {v: r for v, r in releases.items() if v in versions_to_keep}
+    return CleanupResult(
+        kept=kept,
+        removed=sorted(releases.keys() - kept.keys()),
+        groups=network_groups,
+    )
+
+
+def format_changes_summary(changes: Dict[str, Dict[str, List[str]]]) -> str:
+    """Format the added/removed versions per binary as one block of text."""
+    lines = ["", f"{Colors.GREEN}=== Changes Summary ==={Colors.NC}"]
+    has_changes = False
+    for binary, change_info in changes.items():
+        if change_info["added"] or change_info["removed"]:
+            has_changes = True
+            lines.append(f"\n{Colors.BLUE}{binary}:{Colors.NC}")
+            if change_info["added"]:
+                lines.append(f"  {Colors.GREEN}Added:{Colors.NC}")
+                lines.extend(f"    + {version}" for version in change_info["added"])
+            if change_info["removed"]:
+                lines.append(f"  {Colors.YELLOW}Removed:{Colors.NC}")
+                lines.extend(f"    - {version}" for version in change_info["removed"])
 
-    # Return filtered releases and list of removed versions
-    return {
-        v: r for v, r in releases.items() if v in versions_to_keep
-    }, removed_versions
+    if not has_changes:
+        lines.append(f"  {Colors.YELLOW}No changes{Colors.NC}")
+
+    return "\n".join(lines)
+
+
+def format_available_versions(results: Dict[str, CleanupResult]) -> str:
+    """Format the available versions per binary, grouped by network."""
+    lines = ["", f"{Colors.GREEN}=== Available Versions ==={Colors.NC}"]
+    for binary in BINARIES:
+        result = results.get(binary)
+        if result and result.kept:
+            lines.append(
+                f"\n{Colors.BLUE}{binary}:{Colors.NC} ({len(result.kept)} versions)"
+            )
+            for network in sorted(result.groups.keys()):
+                lines.append(f"  {network}: {', '.join(result.groups[network])}")
+
+    return "\n".join(lines)
 
 
 def main():
@@ -292,8 +487,11 @@ Examples:
   %(prog)s                              # Update releases.json in current directory
   %(prog)s nix/releases.json            # Update specific file
   %(prog)s --force                      # Re-download all releases
+  %(prog)s --force --no-cache           # Also ignore cached asset hashes
   %(prog)s --max-releases 5             # Keep only 5 latest per network
   %(prog)s --no-color                   # Disable colored output
+
+Set GITHUB_TOKEN or GH_TOKEN to authenticate GitHub API requests.
         """,
     )
     parser.add_argument(
@@ -305,7 +503,7 @@ Examples:
     parser.add_argument(
         "--force",
         action="store_true",
-        help="Re-download and recompute hashes for existing releases",
+        help="Re-fetch releases from GitHub, reusing cached asset hashes unless --no-cache is given",
     )
     parser.add_argument(
         "--max-releases",
@@ -314,6 +512,11 @@ Examples:
         metavar="N",
         help="Maximum number of releases to keep per network (default: %(default)s)",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Ignore cached asset hashes in {HASH_CACHE_FILENAME} and recompute them",
+    )
     parser.add_argument(
         "--no-color",
         action="store_true",
@@ -322,14 +525,11 @@ Examples:
     args = parser.parse_args()
 
     # Set color output based on --no-color flag or NO_COLOR environment variable
-    global USE_COLOR
-    USE_COLOR = not args.no_color and not os.environ.get("NO_COLOR")
+    global Colors
+    Colors = make_colors(not args.no_color and not os.environ.get("NO_COLOR"))
 
-    print(
-        f"{Colors.GREEN}=== Updating Standalone Releases ==={Colors.NC}",
-        file=sys.stderr,
-    )
-    print("", file=sys.stderr)
+    log(f"{Colors.GREEN}=== Updating Standalone Releases ==={Colors.NC}")
+    log()
 
     releases_json_path = Path(args.file)
 
@@ -339,138 +539,94 @@ Examples:
     # Load existing releases
     existing_releases = {}
     if releases_json_path.exists():
-        # Create backup
+        # Create backup from the same read that is parsed below
+        releases_text = releases_json_path.read_text()
         backup_path = releases_json_path.with_suffix(".json.bak")
-        backup_path.write_text(releases_json_path.read_text())
-        print(
-            f"{Colors.YELLOW}  Backup saved to {backup_path}{Colors.NC}",
-            file=sys.stderr,
-        )
+        backup_path.write_text(releases_text)
+        log(f"{Colors.YELLOW}  Backup saved to {backup_path}{Colors.NC}")
 
         try:
-            existing_releases = json.loads(releases_json_path.read_text())
+            existing_releases = json_loads(releases_text)
         except json.JSONDecodeError:
-            print(
-                f"{Colors.YELLOW}Warning: Could not parse existing {releases_json_path}{Colors.NC}",
-                file=sys.stderr,
+            log(
+                f"{Colors.YELLOW}Warning: Could not parse existing {releases_json_path}{Colors.NC}"
             )
 
-    print("", file=sys.stderr)
+    log()
+
+    # Load cached asset hashes
+    hash_cache_path = releases_json_path.parent / HASH_CACHE_FILENAME
+    if not args.no_cache:
+        load_hash_cache(hash_cache_path)
 
     # Build updated releases structure
     new_releases = {}
+    cleanup_results: Dict[str, CleanupResult] = {}
     # Track changes for summary
     changes: Dict[str, Dict[str, List[str]]] = {}
 
-    for binary in ["mvr", "sui", "walrus", "walrus-sites"]:
+    # Binaries whose releases have to be fetched from GitHub
+    pending = []
+    for binary in BINARIES:
         if binary not in REPOS:
             continue
-
-        # Start with existing releases for this binary
-        existing_binary_releases = existing_releases.get(binary, {})
-        changes[binary] = {"added": [], "removed": []}
-
-        if not args.force and existing_binary_releases:
-            print(
-                f"{Colors.BLUE}Using existing {binary} releases (use --force to re-download){Colors.NC}",
-                file=sys.stderr,
+        if not args.force and existing_releases.get(binary):
+            log(
+                f"{Colors.BLUE}Using existing {binary} releases (use --force to re-download){Colors.NC}"
             )
-            # Still apply cleanup to existing releases
-            cleaned_releases, removed = cleanup_old_releases(
-                existing_binary_releases, args.max_releases
-            )
-            new_releases[binary] = cleaned_releases
-            changes[binary]["removed"] = removed
         else:
-            # Fetch new releases and merge with existing
-            fetched_releases = generate_releases_for_binary(binary, REPOS[binary])
+            pending.append(binary)
+
+    # Fetching is I/O bound, so process all binaries concurrently
+    fetched: Dict[str, Dict[str, Dict[str, str]]] = {}
+    with ThreadPoolExecutor(max_workers=MAX_BINARY_WORKERS) as executor:
+        futures = {
+            executor.submit(generate_releases_for_binary, binary, REPOS[binary]): binary
+            for binary in pending
+        }
+        for future in as_completed(futures):
+            fetched[futures[future]] = future.result()
 
-            # Track newly added versions
-            for version in fetched_releases.keys():
-                if version not in existing_binary_releases:
-                    changes[binary]["added"].append(version)
+    # Merge results on the main thread
+    for binary in BINARIES:
+        if binary not in REPOS:
+            continue
 
-            # Merge: prefer fetched (new) releases, but keep old ones not in new list
-            merged_releases = existing_binary_releases.copy()
-            merged_releases.update(fetched_releases)
+        # Merge: prefer fetched (new) releases, but keep old ones not in new list
+        existing_binary_releases = existing_releases.get(binary, {})
+        fetched_releases = fetched.get(binary, {})
+        merged_releases = {**existing_binary_releases, **fetched_releases}
 
-            # Cleanup: keep only latest N per network
-            cleaned_releases, removed = cleanup_old_releases(
-                merged_releases, args.max_releases
-            )
-            new_releases[binary] = cleaned_releases
-            changes[binary]["removed"] = removed
+        # Cleanup: keep only latest N per network
+        result = cleanup_old_releases(merged_releases, args.max_releases)
+        cleanup_results[binary] = result
+        new_releases[binary] = result.kept
+
+        changes[binary] = {
+            "added": sorted(fetched_releases.keys() - existing_binary_releases.keys()),
+            "removed": result.removed,
+        }
 
     # Write the updated JSON
-    releases_json_path.write_text(json.dumps(new_releases, indent=2) + "\n")
+    releases_json_path.write_text(json_dumps(new_releases))
+    save_hash_cache(hash_cache_path)
 
-    print("", file=sys.stderr)
-    print(
-        f"{Colors.GREEN}✓ Updated {releases_json_path} successfully{Colors.NC}",
-        file=sys.stderr,
-    )
+    log()
+    log(f"{Colors.GREEN}✓ Updated {releases_json_path} successfully{Colors.NC}")
     if releases_json_path.with_suffix(".json.bak").exists():
-        print(
-            f"{Colors.YELLOW}  Backup saved to {releases_json_path.with_suffix('.json.bak')}{Colors.NC}",
-            file=sys.stderr,
+        log(
+            f"{Colors.YELLOW}  Backup saved to {releases_json_path.with_suffix('.json.bak')}{Colors.NC}"
         )
 
-    # Display changes summary
-    print("", file=sys.stderr)
-    print(f"{Colors.GREEN}=== Changes Summary ==={Colors.NC}", file=sys.stderr)
-    has_changes = False
-    for binary, change_info in changes.items():
-        if change_info["added"] or change_info["removed"]:
-            has_changes = True
-            print(f"\n{Colors.BLUE}{binary}:{Colors.NC}", file=sys.stderr)
-            if change_info["added"]:
-                print(f"  {Colors.GREEN}Added:{Colors.NC}", file=sys.stderr)
-                for version in sorted(change_info["added"]):
-                    print(f"    + {version}", file=sys.stderr)
-            if change_info["removed"]:
-                print(f"  {Colors.YELLOW}Removed:{Colors.NC}", file=sys.stderr)
-                for version in sorted(change_info["removed"]):
-                    print(f"    - {version}", file=sys.stderr)
+    # Display changes summary and all available versions per component
+    log(format_changes_summary(changes))
+    log(format_available_versions(cleanup_results))
 
-    if not has_changes:
-        print(f"  {Colors.YELLOW}No changes{Colors.NC}", file=sys.stderr)
-
-    # Display all available versions per component
-    print("", file=sys.stderr)
-    print(f"{Colors.GREEN}=== Available Versions ==={Colors.NC}", file=sys.stderr)
-    for binary in ["mvr", "sui", "walrus", "walrus-sites"]:
-        versions = new_releases.get(binary, {})
-        if versions:
-            print(
-                f"\n{Colors.BLUE}{binary}:{Colors.NC} ({len(versions)} versions)",
-                file=sys.stderr,
-            )
-            # Group by network
-            network_groups: Dict[str, List[str]] = {}
-            for version in versions.keys():
-                network = version.split("-")[0] if "-" in version else "default"
-                if network not in network_groups:
-                    network_groups[network] = []
-                network_groups[network].append(version)
-
-            # Display grouped by network
-            for network in sorted(network_groups.keys()):
-                network_versions = sorted(network_groups[network], reverse=True)
-                print(f"  {network}: {', '.join(network_versions)}", file=sys.stderr)
-
-    print("", file=sys.stderr)
-    print(f"{Colors.GREEN}Example commands:{Colors.NC}", file=sys.stderr)
-    print(
-        f"{Colors.BLUE}  nix build '.#sui'           # Build latest mainnet sui{Colors.NC}",
-        file=sys.stderr,
-    )
-    print(
-        f"{Colors.BLUE}  nix build '.#walrus'        # Build latest mainnet walrus{Colors.NC}",
-        file=sys.stderr,
-    )
-    print(
-        f"{Colors.BLUE}  nix run .#update-releases   # Update releases{Colors.NC}",
-        file=sys.stderr,
+    log(
+        f"\n{Colors.GREEN}Example commands:{Colors.NC}\n"
+        f"{Colors.BLUE}  nix build '.#sui'           # Build latest mainnet sui{Colors.NC}\n"
+        f"{Colors.BLUE}  nix build '.#walrus'        # Build latest mainnet walrus{Colors.NC}\n"
+        f"{Colors.BLUE}  nix run .#update-releases   # Update releases{Colors.NC}"
     )
 
 
@@ -478,8 +634,8 @@ if __name__ == "__main__":
     try:
         main()
     except KeyboardInterrupt:
-        print(f"\n{Colors.YELLOW}Interrupted by user{Colors.NC}", file=sys.stderr)
+        log(f"\n{Colors.YELLOW}Interrupted by user{Colors.NC}")
         sys.exit(1)
     except Exception as e:
-        print(f"{Colors.RED}Error: {e}{Colors.NC}", file=sys.stderr)
+        log(f"{Colors.RED}Error: {e}{Colors.NC}")
         sys.exit(1)